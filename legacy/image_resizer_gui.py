@@ -817,6 +817,9 @@ class ImageResizerWorker(QObject):
                 
             # Now process with the valid image
             with Image.open(self.input_path) as img:
+                # Decode up front so the threads below only read the pixels
+                img.load()
+
                 # Use parallel processing for faster resizing
                 total_tasks = len(self.sizes)
                 completed_tasks = 0
@@ -829,11 +832,7 @@ class ImageResizerWorker(QObject):
                     # Function to resize a single image
                     def resize_image(size):
                         try:
-                            resized_img = img.copy()
-                            if resized_img is None:
-                                return "Failed to copy image - received None object"
-                                
-                            resized_img = resized_img.resize((size, size), Image.LANCZOS)
+                            resized_img = img.resize((size, size), Image.LANCZOS)
                             
                             # Save the resized image
                             if size == 16:
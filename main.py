@@ -3,7 +3,14 @@ Asset Manager Application
 A tool for generating PWA assets and converting image formats.
 """
 
+import multiprocessing
+import os
 import sys
+
+# Smaller Pillow memory blocks (default 16 MiB) keep peak RSS down; this must
+# be set before PIL is first imported
+os.environ.setdefault('PILLOW_BLOCK_SIZE', '1m')
+
 from PyQt5.QtWidgets import QApplication
 from src.ui.main_window import ImageResizerApp
 
@@ -16,4 +23,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    # Worker processes of a frozen build re-run this entry point
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,145 +1,216 @@
 """UI Components for the Asset Manager application."""
 
 from PyQt5.QtWidgets import QLabel, QMessageBox
-from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPixmap
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPixmap, QPixmapCache, QImage, QImageReader
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
+import os
 
-class DropArea(QLabel):
+_IMG_EXTS_SINGLE = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+_IMG_EXTS_MULTI = _IMG_EXTS_SINGLE + ('.webp',)
+
+def _name_filter(exts):
+    return "Image files (" + " ".join(f"*{ext}" for ext in exts) + ")"
+
+IMAGE_FILTER_SINGLE = _name_filter(_IMG_EXTS_SINGLE)
+IMAGE_FILTER_MULTI = _name_filter(_IMG_EXTS_MULTI)
+
+def load_preview(file_path, size=100):
+    """Decode a preview no larger than size x size, scaling inside the decoder."""
+    reader = QImageReader(file_path)
+    if not reader.canRead():
+        # Unsupported or unreadable file: skip the decode entirely
+        return QImage()
+    # Honour EXIF orientation so camera photos aren't previewed sideways
+    reader.setAutoTransform(True)
+    scaled_size = reader.size()
+    if scaled_size.isValid():
+        scaled_size.scale(size, size, Qt.KeepAspectRatio)
+        reader.setScaledSize(scaled_size)
+    return reader.read()
+
+# Drop-area styling, included in the application-wide stylesheet
+DROP_AREA_QSS = """
+    QLabel#dropArea {
+        border: 2px dashed #BBBBBB;
+        border-radius: 10px;
+        background-color: #F0F0F0;
+        padding: 25px;
+    }
+    QLabel#dropArea[dragActive="true"] {
+        border: 2px dashed #2196F3;
+        background-color: #E3F2FD;
+    }
+"""
+
+class DragStateMixin:
+    """Drag highlighting for the drop-area labels, toggled only on state changes."""
+    _drag_active = False
+
+    def _set_drag_active(self, active):
+        # A property change only needs a re-polish, not a stylesheet re-parse
+        if self._drag_active != active:
+            self._drag_active = active
+            self.setProperty("dragActive", active)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+    def dragEnterEvent(self, event: QDragEnterEvent):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+            self._set_drag_active(True)
+
+    def dragLeaveEvent(self, event):
+        self._set_drag_active(False)
+
+class SignalThrottler(QObject):
+    """Forwards values to a slot at most once per interval, always ending on the latest."""
+
+    def __init__(self, slot, interval=50, parent=None):
+        super().__init__(parent)
+        self._slot = slot
+        self._pending = None
+        self._has_pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+
+    def push(self, value):
+        if self._timer.isActive():
+            # Inside the quiet period: keep only the newest value
+            self._pending = value
+            self._has_pending = True
+        else:
+            self._slot(value)
+            self._timer.start()
+
+    def flush(self):
+        """Deliver any value still held back."""
+        if self._has_pending:
+            value = self._pending
+            self._pending = None
+            self._has_pending = False
+            self._slot(value)
+            self._timer.start()
+
+class PreviewSignals(QObject):
+    ready = pyqtSignal(str, QImage)
+
+class PreviewLoader(QRunnable):
+    """Decodes a preview on a thread-pool thread and hands it back as a QImage."""
+
+    def __init__(self, file_path, size=100):
+        super().__init__()
+        self.file_path = file_path
+        self.size = size
+        self.signals = PreviewSignals()
+
+    def run(self):
+        # Unreadable images come back as null QImages rather than raising
+        self.signals.ready.emit(self.file_path, load_preview(self.file_path, self.size))
+
+class PreviewMixin:
+    """Asynchronous preview display for the drop-area labels."""
+    placeholder_text = ""
+    _preview_path = None
+
+    def show_preview(self, file_path, fallback_text=None):
+        """Show a cached preview or start decoding one; fallback_text is shown if it cannot be read."""
+        fallback_text = fallback_text or self.placeholder_text
+        try:
+            mtime = os.path.getmtime(file_path)
+        except (OSError, ValueError):
+            self.show_message(fallback_text)
+            return
+
+        # QPixmapCache is shared by both drop areas and evicted by Qt
+        key = f"preview:{file_path}:{mtime}:100x100"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self._preview_path = None  # Discard any preview still loading
+            self.setPixmap(pixmap)
+            self.setAlignment(Qt.AlignCenter)
+            return
+
+        self._preview_path = file_path
+        self._preview_key = key
+        self._preview_fallback = fallback_text
+        loader = PreviewLoader(file_path)
+        loader.signals.ready.connect(self._on_preview_ready)
+        QThreadPool.globalInstance().start(loader)
+
+    def show_message(self, text):
+        """Show text instead of a preview, discarding any preview still loading."""
+        self._preview_path = None
+        self.setText(text)
+
+    def clear_preview(self):
+        self.show_message(self.placeholder_text)
+
+    def _on_preview_ready(self, file_path, image):
+        if file_path != self._preview_path:
+            return  # Superseded by a newer selection or a reset
+        if image.isNull():
+            self.setText(self._preview_fallback)
+        else:
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self._preview_key, pixmap)
+            self.setPixmap(pixmap)
+            self.setAlignment(Qt.AlignCenter)
+
+class DropArea(DragStateMixin, PreviewMixin, QLabel):
     dropped = pyqtSignal(str)
+    placeholder_text = "Drop Image Here or Click 'Select Input Image'"
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
         self.setAcceptDrops(True)
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
-        self.setText("Drop Image Here or Click 'Select Input Image'")
+        self.setObjectName("dropArea")
+        self.setProperty("dragActive", False)
+        self.setText(self.placeholder_text)
         
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            self.setStyleSheet("""
-                QLabel {
-                    border: 2px dashed #2196F3;
-                    border-radius: 10px;
-                    background-color: #E3F2FD;
-                    padding: 25px;
-                }
-            """)
-    
-    def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
-    
     def dropEvent(self, event: QDropEvent):
         if event.mimeData().hasUrls():
             url = event.mimeData().urls()[0]
             file_path = url.toLocalFile()
-            if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
+            if file_path.lower().endswith(_IMG_EXTS_SINGLE):
                 self.dropped.emit(file_path)
             else:
                 QMessageBox.warning(self, "Invalid File", "Please drop an image file.")
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
-
-class MultiDropArea(QLabel):
+        self._set_drag_active(False)
+
+class MultiDropArea(DragStateMixin, PreviewMixin, QLabel):
     dropped = pyqtSignal(list)
+    placeholder_text = "Drop Image(s) Here or Click 'Select Input'"
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
         self.setAcceptDrops(True)
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
-        self.setText("Drop Image(s) Here or Click 'Select Input'")
+        self.setObjectName("dropArea")
+        self.setProperty("dragActive", False)
+        self.setText(self.placeholder_text)
         
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            self.setStyleSheet("""
-                QLabel {
-                    border: 2px dashed #2196F3;
-                    border-radius: 10px;
-                    background-color: #E3F2FD;
-                    padding: 25px;
-                }
-            """)
-    
-    def dragLeaveEvent(self, event):
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
-    
     def dropEvent(self, event: QDropEvent):
         if event.mimeData().hasUrls():
-            file_paths = []
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')):
-                    file_paths.append(file_path)
+            file_paths = [path for url in event.mimeData().urls()
+                          if (path := url.toLocalFile()).lower().endswith(_IMG_EXTS_MULTI)]
             
             if file_paths:
                 self.dropped.emit(file_paths)
             else:
                 QMessageBox.warning(self, "Invalid Files", "Please drop valid image files.")
         
-        self.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #BBBBBB;
-                border-radius: 10px;
-                background-color: #F0F0F0;
-                padding: 25px;
-            }
-        """)
+        self._set_drag_active(False)
         
     def update_preview(self, file_paths):
         if not file_paths:
-            self.setText("Drop Image(s) Here or Click 'Select Input'")
+            self.clear_preview()
             return
             
-        # If there's just one image, show a preview
-        if len(file_paths) == 1:
-            try:
-                pixmap = QPixmap(file_paths[0])
-                if not pixmap.isNull():
-                    preview = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.setPixmap(preview)
-                    self.setAlignment(Qt.AlignCenter)
-                    return
-            except:
-                pass
-        
-        # If multiple images or preview failed, just show text
+        # If there's just one image, show a preview; fall back to text if it fails
         if len(file_paths) == 1:
-            self.setText(f"1 image selected")
+            self.show_preview(file_paths[0], "1 image selected")
         else:
-            self.setText(f"{len(file_paths)} images selected")
\ No newline at end of file
+            self.show_message(f"{len(file_paths)} images selected")
@@ -1,112 +1,191 @@
 """Main window for the Asset Manager application."""
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QLabel, 
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, 
                            QFileDialog, QMessageBox, QFrame, QProgressBar, 
                            QHBoxLayout, QSizePolicy, QGridLayout, QTabWidget, 
                            QCheckBox, QGroupBox, QRadioButton, QComboBox, QSpinBox)
-from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt, QThread
-from .components import DropArea, MultiDropArea
-from ..workers.image_workers import ImageResizerWorker, ImageConverterWorker
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSlot
+from .components import (DropArea, MultiDropArea, SignalThrottler, DROP_AREA_QSS,
+                         IMAGE_FILTER_SINGLE, IMAGE_FILTER_MULTI)
+from ..workers.image_workers import ImageResizerWorker, ImageConverterWorker, avif_supported
 import os
 
+# PWA icon sizes generated by the resizer (16 becomes favicon.ico)
+_ICON_SIZES = (16, 72, 96, 128, 144, 152, 192, 384, 512)
+
+# Worker format name for each format_combo entry
+_FMT_BY_INDEX = ('WebP', 'JPEG', 'PNG', 'AVIF', 'Both')
+# Quality preset per format index; None keeps the current value. PNG is
+# lossless, so its compression follows the encoder effort instead
+_DEFAULT_QUALITY = (80, 85, None, 60, None)
+
+# Application-wide stylesheet, assembled once at import
+_MAIN_QSS = """
+    QWidget {
+        background-color: #FFFFFF;
+        color: #333333;
+        font-family: 'Roboto', sans-serif;
+    }
+    QLabel {
+        font-size: 12px;
+    }
+    QProgressBar {
+        border: 1px solid #BBBBBB;
+        border-radius: 5px;
+        text-align: center;
+        height: 20px;
+        background-color: #F0F0F0;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 5px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #BBBBBB;
+        border-radius: 5px;
+        top: -1px;
+    }
+    QTabBar::tab {
+        background-color: #F0F0F0;
+        border: 1px solid #BBBBBB;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        padding: 10px 15px;
+    }
+    QTabBar::tab:selected {
+        background-color: #FFFFFF;
+        border-bottom: 1px solid #FFFFFF;
+    }
+    QGroupBox {
+        border: 1px solid #BBBBBB;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QCheckBox, QRadioButton {
+        spacing: 8px;
+    }
+    QComboBox, QSpinBox {
+        border: 1px solid #BBBBBB;
+        border-radius: 3px;
+        padding: 3px;
+    }
+"""
+
+# Action buttons created by create_button
+_BUTTON_QSS = """
+    QPushButton[class="primary"] {
+        background-color: #2196F3; 
+        color: white; 
+        border-radius: 10px; 
+        padding: 12px;
+        width: 200px;
+    }
+    QPushButton[class="primary"]:hover {
+        background-color: #1976D2;
+    }
+    QPushButton[class="primary"]:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton[class="primary"]:disabled {
+        background-color: #BBBBBB;
+        color: #F5F5F5;
+    }
+    QPushButton[class="primary"][spaced="true"] {
+        margin-bottom: 30px;
+    }
+"""
+
+_APP_QSS = _MAIN_QSS + _BUTTON_QSS + DROP_AREA_QSS
+
 class ImageResizerApp(QWidget):
+    # Shared fonts, created once a QApplication exists
+    _BUTTON_FONT = None
+    _LABEL_FONT = None
+    _TITLE_FONT = None
+
     def __init__(self):
         super().__init__()
+        self._init_fonts()
+        # Build and style the whole widget tree with updates off so Qt does
+        # a single layout/paint pass once it is complete
+        self.setUpdatesEnabled(False)
         self.initUI()
         self.apply_stylesheet()
+        # Resolve styles for the whole tree in one pass before re-enabling
+        self.ensurePolished()
+        self.setUpdatesEnabled(True)
 
-    def apply_stylesheet(self):
-        """Apply the application's stylesheet."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                color: #333333;
-                font-family: 'Roboto', sans-serif;
-            }
-            QLabel {
-                font-size: 12px;
-            }
-            QProgressBar {
-                border: 1px solid #BBBBBB;
-                border-radius: 5px;
-                text-align: center;
-                height: 20px;
-                background-color: #F0F0F0;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 5px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #BBBBBB;
-                border-radius: 5px;
-                top: -1px;
-            }
-            QTabBar::tab {
-                background-color: #F0F0F0;
-                border: 1px solid #BBBBBB;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 10px 15px;
-            }
-            QTabBar::tab:selected {
-                background-color: #FFFFFF;
-                border-bottom: 1px solid #FFFFFF;
-            }
-            QGroupBox {
-                border: 1px solid #BBBBBB;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QCheckBox, QRadioButton {
-                spacing: 8px;
-            }
-            QComboBox, QSpinBox {
-                border: 1px solid #BBBBBB;
-                border-radius: 3px;
-                padding: 3px;
-            }
-        """)
+    @classmethod
+    def _init_fonts(cls):
+        if cls._BUTTON_FONT is None:
+            cls._BUTTON_FONT = QFont('Roboto', 12, QFont.Bold)
+            cls._LABEL_FONT = QFont('Roboto', 12)
+            cls._TITLE_FONT = QFont('Roboto', 18, QFont.Bold)
 
-    def create_button(self, text, callback, extra_styles=""):
-        """Create a styled button."""
+    def apply_stylesheet(self):
+        """Apply the application-wide stylesheet."""
+        # Set once on QApplication rather than on this widget so Qt does not
+        # re-resolve the cascade for every child added later
+        app = QApplication.instance()
+        if app.styleSheet() != _APP_QSS:
+            app.setStyleSheet(_APP_QSS)
+
+    def create_button(self, text, callback, spaced=False):
+        """Create a styled button; spaced adds room below it."""
         btn = QPushButton(text, self)
-        btn.setFont(QFont('Roboto', 12, QFont.Bold))
-        base_style = """
-            QPushButton {
-                background-color: #2196F3; 
-                color: white; 
-                border-radius: 10px; 
-                padding: 12px;
-                width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #BBBBBB;
-                color: #F5F5F5;
-            }
-        """
-        btn.setStyleSheet(base_style + extra_styles)
+        btn.setFont(self._BUTTON_FONT)
+        # Styled by the application stylesheet through these properties, so
+        # message-box and dialog buttons keep the native look
+        btn.setProperty("class", "primary")
+        if spaced:
+            btn.setProperty("spaced", True)
         btn.clicked.connect(callback)
         return btn
 
+    def _worker_thread(self, worker):
+        """Move worker onto a new QThread that quits and frees both once the worker is done."""
+        # Parented so dropping the Python reference never destroys a running thread
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        return thread
+
+    @staticmethod
+    def _box_layout():
+        """Vertical layout with explicit spacing and margins so the style isn't queried for them."""
+        layout = QVBoxLayout()
+        layout.setSpacing(6)
+        layout.setContentsMargins(9, 9, 9, 9)
+        return layout
+
+    @staticmethod
+    def _flash_warning(label, text):
+        """Show text in red on a status label for a few seconds instead of a modal box."""
+        label.setStyleSheet("color: #b00020;")
+        label.setText(text)
+        QTimer.singleShot(3000, lambda: label.setStyleSheet("color: #666666;"))
+
+    @staticmethod
+    def _set_enabled(controls, enabled):
+        for control in controls:
+            control.setEnabled(enabled)
+
     def create_label(self, text):
         """Create a styled label."""
         label = QLabel(text, self)
-        label.setFont(QFont('Roboto', 12))
+        label.setFont(self._LABEL_FONT)
         label.setWordWrap(True)
         return label
 
@@ -117,6 +196,13 @@ class ImageResizerApp(QWidget):
 
         self.input_image_path = ""
         self.output_directory = ""
+        self._dialogs = {}  # File dialogs by role, created on first use
+
+        # Worker progress and status reach the widgets at most every 50 ms
+        self.progress_throttle = SignalThrottler(self.update_progress, 50, self)
+        self.status_throttle = SignalThrottler(self.update_status, 50, self)
+        self.converter_progress_throttle = SignalThrottler(self.update_converter_progress, 50, self)
+        self.converter_status_throttle = SignalThrottler(self.update_converter_status, 50, self)
         
         # Create tab widget
         self.tab_widget = QTabWidget()
@@ -129,22 +215,34 @@ class ImageResizerApp(QWidget):
         self.tab_widget.addTab(self.pwa_tab, "PWA Icon Generator")
         self.tab_widget.addTab(self.converter_tab, "Image Format Converter")
         
-        # Set up tabs
+        # Set up tabs; the converter tab is built the first time it is shown
         self.setup_pwa_tab()
-        self.setup_converter_tab()
+        self._converter_built = False
+        self.tab_widget.currentChanged.connect(self._ensure_converter_tab)
         
         # Main layout
-        main_layout = QVBoxLayout()
+        main_layout = self._box_layout()
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
+    @pyqtSlot(int)
+    def _ensure_converter_tab(self, index):
+        """Build the converter tab on first switch to it."""
+        if self._converter_built or self.tab_widget.widget(index) is not self.converter_tab:
+            return
+        self._converter_built = True
+        self.setUpdatesEnabled(False)
+        self.setup_converter_tab()
+        self.converter_tab.ensurePolished()
+        self.setUpdatesEnabled(True)
+
     def setup_pwa_tab(self):
         """Set up the PWA Icon Generator tab."""
-        layout = QVBoxLayout()
+        layout = self._box_layout()
         
         # Title and description
         title_label = QLabel("PWA Asset Generator", self)
-        title_label.setFont(QFont('Roboto', 18, QFont.Bold))
+        title_label.setFont(self._TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1976D2; margin-bottom: 10px;")
         layout.addWidget(title_label)
@@ -163,6 +261,10 @@ class ImageResizerApp(QWidget):
         self.setup_input_section(layout)
         self.add_separator(layout)
         self.setup_output_section(layout)
+
+        self.fast_png_checkbox = QCheckBox("Fast PNG (quicker encoding, slightly larger files)")
+        self.fast_png_checkbox.setChecked(True)
+        layout.addWidget(self.fast_png_checkbox)
         self.add_separator(layout)
 
         # Progress section
@@ -172,7 +274,7 @@ class ImageResizerApp(QWidget):
         self.resize_button = self.create_button(
             'Generate Icons', 
             self.start_resizing, 
-            "\nmargin-top: 30px;\nmargin-bottom: 30px;"
+            spaced=True
         )
         layout.addWidget(self.resize_button, alignment=Qt.AlignCenter)
         
@@ -184,14 +286,16 @@ class ImageResizerApp(QWidget):
         
         layout.addStretch()
         self.pwa_tab.setLayout(layout)
+        # Buttons locked while icons are generated
+        self._pwa_controls = (self.resize_button, self.input_button, self.output_button)
 
     def setup_converter_tab(self):
         """Set up the Image Format Converter tab."""
-        layout = QVBoxLayout()
+        layout = self._box_layout()
         
         # Title and description
         title_label = QLabel("Image Format Converter", self)
-        title_label.setFont(QFont('Roboto', 18, QFont.Bold))
+        title_label.setFont(self._TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1976D2; margin-bottom: 10px;")
         layout.addWidget(title_label)
@@ -217,7 +321,7 @@ class ImageResizerApp(QWidget):
         self.convert_button = self.create_button(
             'Convert Images', 
             self.start_conversion,
-            "\nmargin-top: 30px;\nmargin-bottom: 30px;"
+            spaced=True
         )
         layout.addWidget(self.convert_button, alignment=Qt.AlignCenter)
         
@@ -229,6 +333,9 @@ class ImageResizerApp(QWidget):
         
         layout.addStretch()
         self.converter_tab.setLayout(layout)
+        # Buttons locked while images are converted
+        self._converter_controls = (self.convert_button, self.converter_input_button, self.converter_output_button)
+        self._resize_controls = (self.width_spinbox, self.height_spinbox, self.keep_aspect_ratio)
         
         # Initialize variables
         self.converter_input_files = []
@@ -306,18 +413,41 @@ class ImageResizerApp(QWidget):
         self.format_combo.addItem("JPEG (smaller files)")
         self.format_combo.addItem("PNG (lossless quality)")
         
-        try:
-            from pillow_avif import AvifImagePlugin
+        self.has_avif_support = avif_supported()
+        if self.has_avif_support:
             self.format_combo.addItem("AVIF (best compression)")
-            self.has_avif_support = True
-        except ImportError:
+        else:
             self.format_combo.addItem("AVIF (not available - click for info)")
-            self.has_avif_support = False
 
         self.format_combo.addItem("Both (WebP and AVIF)")
         self.format_combo.currentIndexChanged.connect(self.update_quality_options)
         format_layout.addWidget(self.format_combo)
         output_layout.addLayout(format_layout)
+
+        # Shown in place of a dialog when AVIF is picked without an encoder
+        self._avif_info_label = QLabel(
+            "AVIF needs the pillow-avif package (pip install pillow-avif); restart the application after installing it."
+        )
+        self._avif_info_label.setWordWrap(True)
+        self._avif_info_label.setStyleSheet("color: #b00020;")
+        self._avif_info_label.hide()
+        output_layout.addWidget(self._avif_info_label)
+
+        # Quality and encoder effort
+        quality_layout = QHBoxLayout()
+        quality_layout.addWidget(QLabel("Quality:"))
+        self.quality_slider = QSpinBox()
+        self.quality_slider.setRange(1, 100)
+        self.quality_slider.setValue(80)
+        quality_layout.addWidget(self.quality_slider)
+
+        quality_layout.addWidget(QLabel("Encoder effort:"))
+        self.effort_combo = QComboBox()
+        self.effort_combo.addItems(["Fast", "Balanced", "Max"])
+        self.effort_combo.setCurrentIndex(1)
+        quality_layout.addWidget(self.effort_combo)
+        quality_layout.addStretch()
+        output_layout.addLayout(quality_layout)
         
         # Resize settings
         resize_layout = QHBoxLayout()
@@ -375,15 +505,32 @@ class ImageResizerApp(QWidget):
         separator.setStyleSheet("margin-top: 10px; margin-bottom: 10px;")
         layout.addWidget(separator)
 
+    def _choose(self, role, title, file_mode, name_filter=None):
+        """Run the file dialog kept for role; returns the selected paths, or [] if cancelled."""
+        # One dialog per role is reused, so it reopens where the user last was.
+        # Roles never change file mode: a dialog switched from multi- to
+        # single-selection would still report the old multi-selection.
+        dialog = self._dialogs.get(role)
+        if dialog is None:
+            dialog = self._dialogs[role] = QFileDialog(self, title)
+            dialog.setFileMode(file_mode)
+            if name_filter:
+                dialog.setNameFilter(name_filter)
+            if file_mode == QFileDialog.Directory:
+                dialog.setOption(QFileDialog.ShowDirsOnly)
+        if not dialog.exec_():
+            return []
+        return dialog.selectedFiles()
+
+    @pyqtSlot()
     def select_input_image(self):
         """Handle input image selection."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Input Image", "", 
-            "Image files (*.png *.jpg *.jpeg *.bmp *.gif)"
-        )
+        file_path = self._choose('image', "Select Input Image", QFileDialog.ExistingFile,
+                                 IMAGE_FILTER_SINGLE)
         if file_path:
-            self.set_input_image(file_path)
+            self.set_input_image(file_path[0])
     
+    @pyqtSlot(str)
     def set_input_image(self, file_path):
         """Set the input image and update UI."""
         self.input_image_path = file_path
@@ -391,81 +538,79 @@ class ImageResizerApp(QWidget):
         self.input_label.setText(f"Input Image: {file_name}")
         self.status_label.setText(f"Image '{file_name}' selected")
         
-        # Show preview if possible
-        try:
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                preview = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.drop_area.setPixmap(preview)
-                self.drop_area.setAlignment(Qt.AlignCenter)
-            else:
-                self.drop_area.setText("Drop Image Here or Click 'Select Input Image'")
-        except:
-            self.drop_area.setText("Drop Image Here or Click 'Select Input Image'")
+        # Preview is decoded in the background and shown when ready
+        self.drop_area.show_preview(file_path)
 
+    @pyqtSlot()
     def select_output_directory(self):
         """Handle output directory selection."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        directory = self._choose('directory', "Select Output Directory", QFileDialog.Directory)
         if directory:
+            directory = directory[0]
             self.output_directory = directory
-            self.output_label.setText(f"Output Directory: {os.path.basename(directory)}")
-            self.status_label.setText(f"Output folder set to '{os.path.basename(directory)}'")
+            dir_name = os.path.basename(directory)
+            self.output_label.setText(f"Output Directory: {dir_name}")
+            self.status_label.setText(f"Output folder set to '{dir_name}'")
 
+    @pyqtSlot()
     def start_resizing(self):
         """Start the icon generation process."""
         if not self.input_image_path:
-            QMessageBox.warning(self, "Warning", "Please select an input image.")
+            self._flash_warning(self.status_label, "Please select an input image.")
             return
             
         # If output directory is not selected, use input image's directory
         if not self.output_directory:
-            self.output_directory = os.path.dirname(self.input_image_path)
+            self.output_directory, _ = os.path.split(self.input_image_path)
             dir_name = os.path.basename(self.output_directory)
             self.output_label.setText(f"Output Directory: {dir_name}")
             self.status_label.setText(f"Using input image directory as output: '{dir_name}'")
         
         # Disable UI elements during processing
-        self.resize_button.setEnabled(False)
-        self.input_button.setEnabled(False)
-        self.output_button.setEnabled(False)
+        self._set_enabled(self._pwa_controls, False)
         
-        sizes = [16, 72, 96, 128, 144, 152, 192, 384, 512]
-        self.thread = QThread()
-        self.worker = ImageResizerWorker(self.input_image_path, self.output_directory, sizes)
-        self.worker.moveToThread(self.thread)
+        self.worker = ImageResizerWorker(
+            self.input_image_path,
+            self.output_directory,
+            _ICON_SIZES,
+            self.fast_png_checkbox.isChecked()
+        )
+        thread = self._worker_thread(self.worker)
         
         # Connect signals
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.status_update.connect(self.update_status)
+        self.worker.progress.connect(self.progress_throttle.push)
+        self.worker.status_update.connect(self.status_throttle.push)
         self.worker.finished.connect(self.on_resize_finished)
         self.worker.error.connect(self.on_resize_error)
         
         # Start the thread
         self.progress_bar.setValue(0)
         self.progress_label.setText("Generating icons...")
-        self.thread.start()
+        thread.start()
 
+    @pyqtSlot(int)
     def update_progress(self, value):
         """Update the progress bar."""
         self.progress_bar.setValue(value)
     
+    @pyqtSlot(str)
     def update_status(self, message):
         """Update the status label."""
         self.status_label.setText(message)
 
+    @pyqtSlot()
     def on_resize_finished(self):
         """Handle completion of the resize operation."""
+        self.progress_throttle.flush()
+        self.status_throttle.flush()
         QMessageBox.information(self, "Success", "Icons generated successfully!")
         self.reset_input()
-        self.thread.quit()
-        self.thread.wait()
 
+    @pyqtSlot(str)
     def on_resize_error(self, error_message):
         """Handle errors in the resize operation."""
+        self.status_throttle.flush()
         QMessageBox.critical(self, "Error", error_message)
-        self.thread.quit()
-        self.thread.wait()
         self.reset_ui()
 
     def reset_input(self):
@@ -477,16 +622,14 @@ class ImageResizerApp(QWidget):
         self.progress_bar.setValue(0)
         self.progress_label.setText("Ready to generate icons")
         self.status_label.setText("")
-        self.drop_area.setText("Drop Image Here or Click 'Select Input Image'")
-        self.drop_area.setPixmap(QPixmap())
+        self.drop_area.clear_preview()
         self.reset_ui()
     
     def reset_ui(self):
         """Re-enable UI elements."""
-        self.resize_button.setEnabled(True)
-        self.input_button.setEnabled(True)
-        self.output_button.setEnabled(True)
+        self._set_enabled(self._pwa_controls, True)
 
+    @pyqtSlot()
     def toggle_input_mode(self):
         """Toggle between single and multiple file input modes."""
         if self.single_file_radio.isChecked():
@@ -502,51 +645,43 @@ class ImageResizerApp(QWidget):
             self.converter_input_files = []
             self.converter_input_label.setText("Input File(s): Not selected")
 
+    @pyqtSlot(bool)
     def toggle_resize_options(self, checked):
         """Enable/disable resize options."""
-        self.width_spinbox.setEnabled(checked)
-        self.height_spinbox.setEnabled(checked)
-        self.keep_aspect_ratio.setEnabled(checked)
+        self._set_enabled(self._resize_controls, checked)
 
+    @pyqtSlot(int)
     def update_quality_options(self, index):
         """Update quality settings based on selected format."""
-        # Adjust quality defaults based on format
-        if index == 0:  # WebP
-            self.quality_slider.setValue(80)
-        elif index == 1:  # JPEG
-            self.quality_slider.setValue(85)
-        elif index == 2:  # PNG
-            self.quality_slider.setValue(100)
-        elif index == 3 and not hasattr(self, 'has_avif_support'):
-            QMessageBox.information(
-                self, 
-                "AVIF Support Not Available", 
-                "To enable AVIF format support, please install the required package:\n\n"
-                "pip install pillow-avif\n\n"
-                "After installation, restart the application to use AVIF format."
-            )
-            # Reset to WebP format
+        avif_missing = index == 3 and not self.has_avif_support
+        self._avif_info_label.setVisible(avif_missing)
+        if avif_missing:
+            # Reset to WebP format without re-entering this slot
+            self.format_combo.blockSignals(True)
             self.format_combo.setCurrentIndex(0)
-
+            self.format_combo.blockSignals(False)
+            index = 0
+        self.quality_slider.setEnabled(index != 2)
+        quality = _DEFAULT_QUALITY[index]
+        if quality is not None:
+            self.quality_slider.setValue(quality)
+
+    @pyqtSlot()
     def select_converter_input(self):
         """Handle converter input selection."""
         if self.single_file_radio.isChecked():
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, "Select Input Image", "", 
-                "Image files (*.png *.jpg *.jpeg *.bmp *.gif *.webp)"
-            )
+            file_path = self._choose('converter', "Select Input Image", QFileDialog.ExistingFile,
+                                     IMAGE_FILTER_MULTI)
             if file_path:
-                self.converter_input_files = [file_path]
-                file_name = os.path.basename(file_path)
+                self.converter_input_files = file_path
+                file_name = os.path.basename(file_path[0])
                 self.converter_input_label.setText(f"Input File: {file_name}")
                 self.converter_status_label.setText(f"Selected file: {file_name}")
                 # Update the drop area with preview
                 self.converter_drop_area.update_preview(self.converter_input_files)
         else:
-            file_paths, _ = QFileDialog.getOpenFileNames(
-                self, "Select Input Images", "", 
-                "Image files (*.png *.jpg *.jpeg *.bmp *.gif *.webp)"
-            )
+            file_paths = self._choose('converter_multi', "Select Input Images", QFileDialog.ExistingFiles,
+                                      IMAGE_FILTER_MULTI)
             if file_paths:
                 self.converter_input_files = file_paths
                 self.converter_input_label.setText(f"Input Files: {len(file_paths)} files selected")
@@ -554,44 +689,46 @@ class ImageResizerApp(QWidget):
                 # Update the drop area with preview or count information
                 self.converter_drop_area.update_preview(file_paths)
 
+    @pyqtSlot()
     def select_converter_output(self):
         """Handle converter output directory selection."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        directory = self._choose('directory', "Select Output Directory", QFileDialog.Directory)
         if directory:
+            directory = directory[0]
             self.converter_output_dir = directory
-            self.converter_output_label.setText(f"Output Directory: {os.path.basename(directory)}")
-            self.converter_status_label.setText(f"Output folder set to '{os.path.basename(directory)}'")
+            dir_name = os.path.basename(directory)
+            self.converter_output_label.setText(f"Output Directory: {dir_name}")
+            self.converter_status_label.setText(f"Output folder set to '{dir_name}'")
 
+    @pyqtSlot()
     def start_conversion(self):
         """Start the image conversion process."""
         if not self.converter_input_files:
-            QMessageBox.warning(self, "Warning", "Please select input file(s).")
+            self._flash_warning(self.converter_status_label, "Please select input file(s).")
             return
 
         if not self.converter_output_dir:
-            if len(self.converter_input_files) == 1:
-                self.converter_output_dir = os.path.dirname(self.converter_input_files[0])
+            input_dirs = {os.path.dirname(f) for f in self.converter_input_files}
+            if len(input_dirs) == 1:
+                self.converter_output_dir, = input_dirs
                 dir_name = os.path.basename(self.converter_output_dir)
                 self.converter_output_label.setText(f"Output Directory: {dir_name}")
-                self.converter_status_label.setText(f"Using input file directory as output: '{dir_name}'")
-            else:
-                input_dirs = {os.path.dirname(f) for f in self.converter_input_files}
-                if len(input_dirs) == 1:
-                    self.converter_output_dir = list(input_dirs)[0]
-                    dir_name = os.path.basename(self.converter_output_dir)
-                    self.converter_output_label.setText(f"Output Directory: {dir_name}")
-                    self.converter_status_label.setText(f"Using common input directory as output: '{dir_name}'")
+                if len(self.converter_input_files) == 1:
+                    self.converter_status_label.setText(f"Using input file directory as output: '{dir_name}'")
                 else:
-                    QMessageBox.warning(
-                        self, 
-                        "Output Directory Required", 
-                        "Input files are from different directories. Please select an output directory."
-                    )
-                    return
+                    self.converter_status_label.setText(f"Using common input directory as output: '{dir_name}'")
+            else:
+                QMessageBox.warning(
+                    self, 
+                    "Output Directory Required", 
+                    "Input files are from different directories. Please select an output directory."
+                )
+                return
 
-        format_index = self.format_combo.currentIndex()
+        output_format = _FMT_BY_INDEX[self.format_combo.currentIndex()]
 
-        if format_index == 3 and not hasattr(self, 'has_avif_support'):
+        # "Both" writes AVIF too
+        if output_format in ('AVIF', 'Both') and not self.has_avif_support:
             QMessageBox.warning(
                 self, 
                 "Format Not Available", 
@@ -599,17 +736,6 @@ class ImageResizerApp(QWidget):
             )
             return
 
-        if format_index == 0:
-            output_format = 'WebP'
-        elif format_index == 1:
-            output_format = 'JPEG'
-        elif format_index == 2:
-            output_format = 'PNG'
-        elif hasattr(self, 'has_avif_support') and format_index == 3:
-            output_format = 'AVIF'
-        elif format_index == 4:  # Both (WebP and AVIF)
-            output_format = 'Both'
-
         resize_settings = None
         if self.resize_checkbox.isChecked():
             resize_settings = {
@@ -618,49 +744,51 @@ class ImageResizerApp(QWidget):
                 'keep_aspect_ratio': self.keep_aspect_ratio.isChecked()
             }
 
-        self.convert_button.setEnabled(False)
-        self.converter_input_button.setEnabled(False)
-        self.converter_output_button.setEnabled(False)
+        self._set_enabled(self._converter_controls, False)
 
-        self.convert_thread = QThread()
         self.convert_worker = ImageConverterWorker(
             self.converter_input_files,
             self.converter_output_dir,
             output_format,
-            resize_settings
+            quality=self.quality_slider.value(),
+            resize_settings=resize_settings,
+            effort=self.effort_combo.currentText()
         )
-        self.convert_worker.moveToThread(self.convert_thread)
+        thread = self._worker_thread(self.convert_worker)
 
-        self.convert_thread.started.connect(self.convert_worker.run)
-        self.convert_worker.progress.connect(self.update_converter_progress)
-        self.convert_worker.status_update.connect(self.update_converter_status)
-        self.convert_worker.finished.connect(self.on_conversion_finished)
-        self.convert_worker.error.connect(self.on_conversion_error)
+        self.convert_worker.progress.connect(self.converter_progress_throttle.push, Qt.QueuedConnection)
+        self.convert_worker.status_update.connect(self.converter_status_throttle.push, Qt.QueuedConnection)
+        self.convert_worker.finished.connect(self.on_conversion_finished, Qt.QueuedConnection)
+        self.convert_worker.error.connect(self.on_conversion_error, Qt.QueuedConnection)
 
         self.converter_progress_bar.setValue(0)
         self.converter_progress_label.setText("Converting images...")
-        self.convert_thread.start()
+        thread.start()
 
+    @pyqtSlot(int)
     def update_converter_progress(self, value):
         """Update the converter progress bar."""
-        self.converter_progress_bar.setValue(value)
+        if value != self.converter_progress_bar.value():
+            self.converter_progress_bar.setValue(value)
     
+    @pyqtSlot(str)
     def update_converter_status(self, message):
         """Update the converter status label."""
         self.converter_status_label.setText(message)
 
+    @pyqtSlot()
     def on_conversion_finished(self):
         """Handle completion of the conversion operation."""
+        self.converter_progress_throttle.flush()
+        self.converter_status_throttle.flush()
         QMessageBox.information(self, "Success", "Images converted successfully!")
         self.reset_converter()
-        self.convert_thread.quit()
-        self.convert_thread.wait()
 
+    @pyqtSlot(str)
     def on_conversion_error(self, error_message):
         """Handle errors in the conversion operation."""
+        self.converter_status_throttle.flush()
         QMessageBox.critical(self, "Error", error_message)
-        self.convert_thread.quit()
-        self.convert_thread.wait()
         self.reset_converter_ui()
     
     def reset_converter(self):
@@ -672,16 +800,14 @@ class ImageResizerApp(QWidget):
         self.converter_progress_bar.setValue(0)
         self.converter_progress_label.setText("Ready to convert")
         self.converter_status_label.setText("")
-        self.converter_drop_area.setText("Drop Image(s) Here or Click 'Select Input'")
-        self.converter_drop_area.setPixmap(QPixmap())
+        self.converter_drop_area.clear_preview()
         self.reset_converter_ui()
     
     def reset_converter_ui(self):
         """Re-enable converter UI elements."""
-        self.convert_button.setEnabled(True)
-        self.converter_input_button.setEnabled(True)
-        self.converter_output_button.setEnabled(True)
+        self._set_enabled(self._converter_controls, True)
 
+    @pyqtSlot(list)
     def set_converter_input_files(self, file_paths):
         """Handle dropped files in the converter."""
         self.converter_input_files = file_paths
@@ -1,10 +1,420 @@
 """Workers for image processing operations."""
 
-from PyQt5.QtCore import QObject, pyqtSignal
-from PIL import Image
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+import PIL
+from PIL import Image, features
+from multiprocessing import shared_memory
 import os
 import concurrent.futures
+import contextlib
+import ctypes
+import functools
+import gc
+import io
+import itertools
 import json
+import logging
+import mmap
+import multiprocessing
+import platform
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Pillow-SIMD (an opt-in drop-in for Pillow, see requirements.txt) carries a
+# ".postN" version suffix; stock Pillow uses the scalar resampling code.
+PILLOW_SIMD = '.post' in PIL.__version__
+logger.info("Pillow %s (SIMD: %s, libjpeg-turbo: %s)",
+            PIL.__version__, PILLOW_SIMD, features.check('libjpeg_turbo'))
+# Pool processes re-import this module under spawn; only the app itself logs
+if (not PILLOW_SIMD and platform.machine() in ('x86_64', 'AMD64')
+        and multiprocessing.parent_process() is None):
+    logger.info("Stock Pillow on x86: pillow-simd is an optional drop-in "
+                "(see requirements.txt) for vectorised LANCZOS resizing")
+
+# Check if GPU JPEG decoding is available
+try:
+    from nvidia import nvimgcodec  # This is an optional dependency
+    import numpy as np
+except ImportError:
+    # nvImageCodec is not installed - JPEGs are decoded by Pillow
+    nvimgcodec = None
+
+_gpu_decoder = None
+
+# Encoder settings behind the converter's "Encoder effort" choice. PNG is
+# lossless, so effort alone picks its zlib level; Pillow's optimize flag
+# adds an extra filter search on top of level 9, so only Max uses it.
+ENCODER_EFFORT = {
+    'Fast': {
+        'WebP': {'method': 2},
+        'JPEG': {'optimize': False, 'progressive': False, 'subsampling': 2},
+        'AVIF': {'speed': 8},
+        'PNG': {'compress_level': 1},
+    },
+    'Balanced': {
+        'WebP': {'method': 4},
+        'JPEG': {'optimize': False, 'progressive': False, 'subsampling': 2},
+        'AVIF': {'speed': 6},
+        'PNG': {'compress_level': 6},
+    },
+    'Max': {
+        'WebP': {'method': 6},
+        'JPEG': {'optimize': True, 'progressive': True},
+        'AVIF': {'speed': 4},
+        'PNG': {'compress_level': 9, 'optimize': True},
+    },
+}
+
+# zlib level for the icon generator's "Fast PNG" option; for icon-sized
+# images it is several times faster than Pillow's default of 6 and only
+# a few percent larger
+FAST_PNG_COMPRESS_LEVEL = 1
+
+# Worker pools always spawn fresh interpreters: forking from a worker QThread
+# would copy a multi-threaded Qt process (encoder and preview threads, a CUDA
+# context) and can deadlock. This also matches Windows and macOS.
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# Inputs at least this large on a network drive are read through a memory map
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# The process umask, read once at import while no worker threads exist (it
+# can only be read by setting it); outputs get the mode a plain open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+NETWORK_FILESYSTEMS = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', '9p', 'afs', 'ceph', 'glusterfs', 'fuse.sshfs'}
+
+# Check if jpegli decoding is available
+try:
+    import ajpegli  # This is an optional dependency
+except ImportError:
+    # ajpegli is not installed - JPEGs are decoded by libjpeg-turbo
+    ajpegli = None
+
+# Check if the Rust SIMD resampler is available
+try:
+    import pic_scale  # This is an optional dependency
+except ImportError:
+    # pic-scale is not installed - images are resized by Pillow
+    pic_scale = None
+
+
+@functools.lru_cache(maxsize=1)
+def register_avif():
+    """Register pillow-avif-plugin, if installed, on first need rather than at import."""
+    try:
+        from pillow_avif import AvifImagePlugin  # This is an optional dependency
+    except ImportError:
+        # pillow-avif-plugin is not installed - AVIF needs Pillow's own plugin (11.2+)
+        return None
+    return AvifImagePlugin
+
+
+def avif_supported():
+    """Whether Pillow can write AVIF, natively or through pillow-avif-plugin."""
+    register_avif()
+    Image.init()
+    return 'AVIF' in Image.SAVE
+
+
+def save_icon(resized_img, size, output_dir, png_options):
+    """Encode one RGBA icon; runs in a worker process."""
+    file_name = 'favicon.ico' if size == 16 else f'icon-{size}x{size}.png'
+    output_path = os.path.join(output_dir, file_name)
+    try:
+        # Encode in memory so the file is written in one go, like the converter's outputs
+        buffer = io.BytesIO()
+        if size == 16:
+            resized_img.save(buffer, format='ICO', sizes=[(16, 16)])
+        else:
+            resized_img.save(buffer, format='PNG', **png_options)
+        write_atomic(output_path, buffer.getbuffer())
+    except Exception as save_error:
+        return f"Failed to save {file_name}: {str(save_error)}"
+    return True
+
+
+def release_memory():
+    """Collect garbage and hand freed heap arenas back to the OS."""
+    gc.collect()
+    if sys.platform.startswith('linux'):
+        try:
+            ctypes.CDLL('libc.so.6').malloc_trim(0)
+        except (OSError, AttributeError):
+            pass  # Not glibc
+
+
+def save_shared_icon(shm_name, offset, size, output_dir, png_options):
+    """Encode one RGBA icon published in shared memory; runs in a worker process."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf[offset:offset + size * size * 4] as pixels:
+            # A zero-copy view: the pixels never travel through the pool's pipe
+            icon = Image.frombuffer('RGBA', (size, size), pixels, 'raw', 'RGBA', 0, 1)
+            result = save_icon(icon, size, output_dir, png_options)
+            del icon  # Release the buffer export before the view is closed
+        return result
+    finally:
+        shm.close()
+
+
+def target_size(size, resize_settings):
+    """Return the (width, height) an image of the given size is resized to."""
+    original_width, original_height = size
+    target_width = resize_settings['width']
+    target_height = resize_settings['height']
+
+    if resize_settings['keep_aspect_ratio']:
+        aspect_ratio = original_width / original_height
+        if original_width > original_height:
+            return target_width, int(target_width / aspect_ratio)
+        return int(target_height * aspect_ratio), target_height
+    return target_width, target_height
+
+
+def resample_mode(img):
+    """Return img in a mode Pillow can Lanczos-resample.
+
+    Palette and bilevel images are converted to RGB(A), since Pillow would
+    otherwise resize them with nearest-neighbour; every other mode (L, LA,
+    I;16, I, F, RGB, RGBA, ...) is kept as it is.
+    """
+    if img.mode not in ('P', '1'):
+        return img
+    return img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+
+
+def lanczos(img, size, reducing_gap=None):
+    """LANCZOS-resize an image, through pic-scale for RGB/RGBA when it is installed."""
+    if pic_scale is not None and img.mode in ('RGB', 'RGBA'):
+        return pic_scale.resize(img, size, pic_scale.Resampling.LANCZOS)
+    return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+
+
+def draft(img, size):
+    """Let libjpeg decode at 1/2, 1/4 or 1/8 scale while staying at least twice size."""
+    if img.format == 'JPEG':
+        img.draft(img.mode, (size[0] * 2, size[1] * 2))
+
+
+@functools.lru_cache(maxsize=1)
+def _mounts():
+    """Return (mount point, filesystem type) pairs, longest mount point first."""
+    try:
+        with open('/proc/mounts') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return ()
+    return tuple(sorted(((point.replace('\\040', ' '), fs_type) for point, fs_type in mounts),
+                        key=lambda mount: len(mount[0]), reverse=True))
+
+
+def on_network_drive(file_path):
+    """Whether a file lives on a network share, where a memory map's readahead pays off."""
+    path = os.path.abspath(file_path)
+    if os.name == 'nt':
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith('\\\\'):
+            return True  # UNC path
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == 4  # DRIVE_REMOTE
+    for point, fs_type in _mounts():
+        if path == point or path.startswith(point.rstrip('/') + '/'):
+            return fs_type in NETWORK_FILESYSTEMS
+    return False
+
+
+@contextlib.contextmanager
+def open_image(file_path):
+    """Open an image, reading large files on network drives through a read-only memory map.
+
+    The image must be loaded inside the block; it is not closed on exit.
+    """
+    # Local disks are served as well or better by buffered reads
+    if os.path.getsize(file_path) < MMAP_THRESHOLD or not on_network_drive(file_path):
+        yield Image.open(file_path)
+        return
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield Image.open(mm)
+
+
+def gpu_decode(file_path):
+    """Decode a JPEG with nvImageCodec; returns None if no GPU decoder is usable."""
+    global _gpu_decoder, nvimgcodec
+    try:
+        if _gpu_decoder is None:
+            _gpu_decoder = nvimgcodec.Decoder()
+    except Exception as e:
+        # No CUDA device or driver; stop trying for the rest of the session
+        logger.info("GPU decoding unavailable: %s", e)
+        nvimgcodec = None
+        return None
+    try:
+        decoded = _gpu_decoder.read(file_path, nvimgcodec.DecodeParams(apply_exif_orientation=False))
+        return Image.fromarray(np.asarray(decoded.cpu()))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def encode_pool():
+    """One encoder thread per core, shared by every conversion in this process."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                 thread_name_prefix='encode')
+
+
+def decode_file(file_path, resize_settings=None):
+    """Open and fully decode an image; returns it with its resize target, if any."""
+    with open_image(file_path) as img:
+        new_size = target_size(img.size, resize_settings) if resize_settings else None
+        # Pool processes never open a GPU decoder (and CUDA context) of their own
+        if (img.format == 'JPEG' and nvimgcodec is not None
+                and multiprocessing.parent_process() is None):
+            gpu_img = gpu_decode(file_path)
+            if gpu_img is not None:
+                img.close()
+                return gpu_img, new_size
+        if img.format == 'JPEG' and ajpegli is not None and not new_size:
+            # jpegli decodes faster and without the GIL; draft() wins when resizing
+            img.close()
+            return Image.fromarray(ajpegli.imread(file_path, mode='RGB')), new_size
+        if new_size:
+            draft(img, new_size)
+        img.load()
+    return img, new_size
+
+
+def save_options(output_format, quality, effort):
+    """Return the Image.save keyword arguments for a format, quality and effort."""
+    if output_format == 'PNG':
+        # PNG is lossless: quality does not apply, effort picks the zlib level.
+        # icc_profile=None keeps Pillow from copying the source's profile over
+        return {'icc_profile': None, **ENCODER_EFFORT[effort]['PNG']}
+    return {'quality': quality, **ENCODER_EFFORT[effort].get(output_format, {})}
+
+
+def avif_size(size):
+    """Round a size down to the multiple-of-8 dimensions AVIF output uses."""
+    width, height = size
+    if width % 8 == 0 and height % 8 == 0:
+        return size
+    new_width = (width // 8) * 8
+    new_height = round(new_width * height / width)
+    return new_width, (new_height // 8) * 8
+
+
+def _save_jpeg(img, fp, **options):
+    # Only convert when JPEG cannot store the mode as-is
+    if img.mode not in ('RGB', 'L', 'CMYK'):
+        img = img.convert('RGB')
+    img.save(fp, format='JPEG', **options)
+
+
+# Per-format encoders; the converter binds each one's options once per batch
+SAVE_IMPLS = {
+    'WebP': functools.partial(Image.Image.save, format='WebP'),
+    'JPEG': _save_jpeg,
+    'PNG': functools.partial(Image.Image.save, format='PNG'),
+    'AVIF': functools.partial(Image.Image.save, format='AVIF'),
+}
+
+# Output file extension per converter format
+EXTENSIONS = {
+    'WebP': '.webp',
+    'JPEG': '.jpg',
+    'PNG': '.png',
+    'AVIF': '.avif'
+}
+
+# manifest.json contents; "icons" is filled in per icon set
+MANIFEST_TEMPLATE = {
+    "name": "PWA App",
+    "short_name": "PWA",
+    "icons": None,
+    "start_url": ".",
+    "display": "standalone",
+    "theme_color": "#ffffff",
+    "background_color": "#ffffff"
+}
+
+
+def write_atomic(output_path, data):
+    """Write data to a uniquely named temporary file beside output_path, then move it into place."""
+    # delete=False: the file is renamed over the output, which Windows
+    # does not allow while it is still open
+    # The prefix ties errors and any leftover .part file to their output
+    part = tempfile.NamedTemporaryFile(dir=os.path.dirname(output_path),
+                                       prefix=os.path.basename(output_path) + '.',
+                                       suffix='.part', delete=False)
+    try:
+        with part:
+            part.write(data)
+        # NamedTemporaryFile creates 0600 files; give the output the usual mode
+        os.chmod(part.name, 0o666 & ~_UMASK)
+        os.replace(part.name, output_path)
+    except BaseException:
+        os.remove(part.name)
+        raise
+
+
+def encode_file(img, file_path, output_dir, targets, new_size=None):
+    """Resize a decoded image and write it out once per (format, extension, save) target."""
+    if any(output_format == 'AVIF' for output_format, _, _ in targets):
+        # Pool processes register the plugin themselves
+        register_avif()
+    try:
+        with img:
+            base_name = os.path.splitext(os.path.basename(file_path))[0]
+            resized = {}  # Output size -> image, shared between targets
+
+            for output_format, extension, save in targets:
+                output_path = os.path.join(output_dir, f"{base_name}{extension}")
+
+                out_size = new_size or img.size
+                if output_format == 'AVIF':
+                    if new_size:
+                        # Fold AVIF's 8-pixel alignment into the single resize
+                        out_size = avif_size(out_size)
+                    else:
+                        out_size = (img.width // 8 * 8, img.height // 8 * 8)
+
+                if out_size == img.size:
+                    out_img = img
+                elif out_size in resized:
+                    out_img = resized[out_size]
+                elif not new_size:
+                    # Only alignment changes the size: trim the last few
+                    # rows/columns rather than resampling the whole image
+                    out_img = resized[out_size] = img.crop((0, 0) + out_size)
+                else:
+                    # reducing_gap box-reduces big downscales to 3x the target first,
+                    # so Lanczos only runs over a fraction of the source pixels
+                    out_img = resized[out_size] = lanczos(resample_mode(img), out_size, reducing_gap=3.0)
+
+                # Encode in memory, then write once and swap the file in, so a
+                # crash never leaves a truncated output behind
+                buffer = io.BytesIO()
+                save(out_img, buffer)
+                write_atomic(output_path, buffer.getbuffer())
+
+            return True
+    except Exception as e:
+        return f"Error converting {os.path.basename(file_path)}: {str(e)}"
+
+
+def convert_file(file_path, output_dir, targets, resize_settings=None):
+    """Decode, resize and encode one file; runs in a worker process."""
+    try:
+        img, new_size = decode_file(file_path, resize_settings)
+    except Exception as e:
+        return f"Error converting {os.path.basename(file_path)}: {str(e)}"
+    return encode_file(img, file_path, output_dir, targets, new_size)
+
 
 class ImageResizerWorker(QObject):
     finished = pyqtSignal()
@@ -12,18 +422,49 @@ class ImageResizerWorker(QObject):
     progress = pyqtSignal(int)
     status_update = pyqtSignal(str)
 
-    def __init__(self, input_path, output_dir, sizes):
+    def __init__(self, input_path, output_dir, sizes, fast_png=False):
         super().__init__()
         self.input_path = input_path
         self.output_dir = output_dir
         self.sizes = sizes
-
+        self.png_options = {'optimize': False, 'compress_level': FAST_PNG_COMPRESS_LEVEL} if fast_png else {}
+        self._manifest_bytes = self._build_manifest()
+
+    def _build_manifest(self):
+        """Serialise manifest.json for the configured sizes."""
+        manifest_icons = [
+            {
+                "src": f"icon-{size}x{size}.png",
+                "sizes": f"{size}x{size}",
+                "type": "image/png"
+            }
+            for size in self.sizes if size != 16
+        ]
+        manifest_content = dict(MANIFEST_TEMPLATE, icons=manifest_icons)
+        return json.dumps(manifest_content, indent=2).encode('utf-8')
+
+    def _resize_one(self, base, size):
+        """Resize one icon straight from the base, never from another icon."""
+        # Chaining icons off each other compounds Lanczos blur with every pass;
+        # the base is only twice the largest icon, so one pass each is cheap
+        return lanczos(base, (size, size), reducing_gap=3.0)
+
+    @pyqtSlot()
     def run(self):
+        started = time.perf_counter_ns()
         try:
-            # First verify the image can be opened
+            # Decode the source once; every icon is derived from it in memory
             try:
-                with Image.open(self.input_path) as img:
-                    img.size  # Verify image is valid
+                with open_image(self.input_path) as img:
+                    # Icons never need more than twice the largest size
+                    largest = max(self.sizes)
+                    draft(img, (largest, largest))
+                    img.load()
+                    if img.mode == 'RGBA':
+                        src = img
+                    else:
+                        src = img.convert('RGBA')
+                        img.close()
             except Exception as e:
                 self.error.emit(f"Failed to open image: {str(e)}")
                 return
@@ -32,73 +473,73 @@ class ImageResizerWorker(QObject):
             completed_tasks = 0
             self.status_update.emit("Loading image...")
 
-            def resize_image(size):
-                try:
-                    with Image.open(self.input_path) as img:
-                        resized_img = img.resize((size, size), Image.LANCZOS)
-
-                        if size == 16:
-                            output_path = os.path.join(self.output_dir, 'favicon.ico')
-                            if resized_img.mode != 'RGBA':
-                                resized_img = resized_img.convert('RGBA')
-                            try:
-                                resized_img.save(output_path, format='ICO', sizes=[(16, 16)])
-                            except Exception as save_error:
-                                return f"Failed to save favicon.ico: {str(save_error)}"
-                        else:
-                            output_path = os.path.join(self.output_dir, f'icon-{size}x{size}.png')
-                            try:
-                                resized_img.save(output_path, format='PNG')
-                            except Exception as save_error:
-                                return f"Failed to save icon-{size}x{size}.png: {str(save_error)}"
-
-                        return True
-                except Exception as e:
-                    return f"Failed to resize image to {size}x{size}: {str(e)}"
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = [executor.submit(resize_image, size) for size in self.sizes]
-
-                for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                    result = future.result()
-                    if result is not True:
-                        self.error.emit(f"Failed to resize image: {result}")
-                        return
-
-                    completed_tasks += 1
-                    progress_value = int((completed_tasks / total_tasks) * 100)
-                    self.progress.emit(progress_value)
-                    self.status_update.emit(f"Generating icons: {completed_tasks}/{total_tasks}")
-
-            # Create manifest.json
-            manifest_icons = [
-                {
-                    "src": f"icon-{size}x{size}.png",
-                    "sizes": f"{size}x{size}",
-                    "type": "image/png"
-                }
-                for size in self.sizes if size != 16
-            ]
-
-            manifest_content = {
-                "name": "PWA App",
-                "short_name": "PWA",
-                "icons": manifest_icons,
-                "start_url": ".",
-                "display": "standalone",
-                "theme_color": "#ffffff",
-                "background_color": "#ffffff"
-            }
+            # PNG/ICO encoding holds the GIL for much of its work, so the
+            # encodes are spread over processes (at most one per icon) while
+            # resizing stays here
+            max_workers = max(1, min(len(self.sizes), os.cpu_count() or 1))
 
+            # Publish every icon's pixels in one shared block rather than
+            # pickling each image across to the encoder processes
+            shm = shared_memory.SharedMemory(create=True, size=sum(4 * size * size for size in self.sizes))
             try:
-                with open(os.path.join(self.output_dir, 'manifest.json'), 'w') as f:
-                    json.dump(manifest_content, f, indent=2)
-            except Exception as e:
-                self.error.emit(f"Failed to create manifest.json: {str(e)}")
-                return
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                            mp_context=MP_CONTEXT) as executor:
+                    futures = []
+
+                    # Shrink large sources once to twice the largest icon; every
+                    # icon is then resized from this much smaller intermediate.
+                    # reducing_gap box-reduces by an integer factor first, so
+                    # Lanczos never runs over the full-resolution source
+                    base_size = 2 * max(self.sizes)
+                    base = src
+                    if src.size[0] > base_size and src.size[1] > base_size:
+                        base = lanczos(src, (base_size, base_size), reducing_gap=3.0)
+                    del src
+
+                    offset = 0
+                    for size in sorted(self.sizes, reverse=True):
+                        try:
+                            icon = self._resize_one(base, size)
+                        except Exception as e:
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            self.error.emit(f"Failed to resize image: Failed to resize image to {size}x{size}: {str(e)}")
+                            return
+                        shm.buf[offset:offset + 4 * size * size] = icon.tobytes()
+                        futures.append(executor.submit(
+                            save_shared_icon, shm.name, offset, size, self.output_dir, self.png_options))
+                        offset += 4 * size * size
+
+                    # The encoders only need the shared block from here on
+                    del img, base, icon
+
+                    for future in concurrent.futures.as_completed(futures):
+                        result = future.result()
+                        if result is not True:
+                            # Drop the icons that have not started; leaving the
+                            # with block still waits for the running ones
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            self.error.emit(f"Failed to resize image: {result}")
+                            return
+
+                        completed_tasks += 1
+                        progress_value = int((completed_tasks / total_tasks) * 100)
+                        self.progress.emit(progress_value)
+                        self.status_update.emit(f"Generating icons: {completed_tasks}/{total_tasks}")
+
+                    # Only a complete icon set gets a manifest pointing at it
+                    try:
+                        write_atomic(os.path.join(self.output_dir, 'manifest.json'), self._manifest_bytes)
+                    except Exception as e:
+                        self.error.emit(f"Failed to create manifest.json: {str(e)}")
+                        return
+            finally:
+                shm.close()
+                shm.unlink()
 
-            self.status_update.emit("All icons generated successfully!")
+            elapsed = (time.perf_counter_ns() - started) / 1e9
+            self.status_update.emit(f"All icons generated successfully in {elapsed:.1f}s!")
             self.progress.emit(100)
+            release_memory()
             self.finished.emit()
 
         except FileNotFoundError:
@@ -115,101 +556,166 @@ class ImageConverterWorker(QObject):
     progress = pyqtSignal(int)
     status_update = pyqtSignal(str)
 
-    def __init__(self, input_files, output_dir, output_format, resize_settings=None):
+    # Minimum seconds between progress updates (~30 Hz)
+    EMIT_INTERVAL = 1 / 30
+
+    def __init__(self, input_files, output_dir, output_format, quality=100,
+                 resize_settings=None, effort='Balanced'):
         super().__init__()
         self.input_files = input_files
         self.output_dir = output_dir
         self.output_format = output_format
+        self.quality = quality
         self.resize_settings = resize_settings
+        self.effort = effort
+        self.processed_files = 0
+        self._last_emit = 0.0
+        self._last_progress = -1
+
+    def use_processes(self):
+        """Whether to spread the batch over processes rather than threads."""
+        # Spawning interpreters costs more than it saves for a single file,
+        # and frozen Windows builds pay for a full bootstrap per process.
+        # With a GPU decoder the threaded pipeline's single decoder thread
+        # feeds it, rather than one CUDA context per pool process
+        return (len(self.input_files) > 1 and not getattr(sys, 'frozen', False)
+                and nvimgcodec is None)
+
+    def _file_done(self):
+        """Count a converted file and report progress, at most EMIT_INTERVAL apart."""
+        self.processed_files += 1
+        total_files = len(self.input_files)
+
+        # Coalesce updates so large batches don't flood the GUI thread: only
+        # when the whole percentage moves, and no more often than EMIT_INTERVAL
+        progress_value = int((self.processed_files / total_files) * 100)
+        if progress_value == self._last_progress and self.processed_files != total_files:
+            return
+        now = time.monotonic()
+        if now - self._last_emit >= self.EMIT_INTERVAL or self.processed_files == total_files:
+            self._last_emit = now
+            self._last_progress = progress_value
+            self.progress.emit(progress_value)
+            self.status_update.emit(f"Converting files: {self.processed_files}/{total_files}")
+
+    def _convert_in_processes(self, targets):
+        """Decode and encode each file in a worker process; returns the first error, if any."""
+        # One process per core, but never more processes than files
+        max_workers = max(1, min(len(self.input_files), os.cpu_count() or 1))
+        # Hand files out in chunks so large batches spend less time on IPC
+        chunksize = max(1, len(self.input_files) // (4 * max_workers))
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=MP_CONTEXT)
+        try:
+            results = executor.map(convert_file, self.input_files, itertools.repeat(self.output_dir),
+                                   itertools.repeat(targets), itertools.repeat(self.resize_settings),
+                                   chunksize=chunksize)
+            for result in results:
+                if result is not True:
+                    return result
+                self._file_done()
+        finally:
+            # Drop whatever has not started yet if we bailed out early
+            executor.shutdown(cancel_futures=True)
+        return None
+
+    def _convert_in_threads(self, targets):
+        """Decode on one thread and encode on a thread pool; returns the first error, if any."""
+        # Two-stage pipeline: one thread decodes ahead into a bounded queue
+        # while the pool resizes and encodes, so throughput is limited by
+        # the slower stage rather than the sum of both.
+        max_workers = max(1, min(len(self.input_files), os.cpu_count() or 1))
+        decoded = queue.Queue(maxsize=2 * max_workers)
+        stop = threading.Event()
+
+        def decode_files():
+            for file_path in self.input_files:
+                if stop.is_set():
+                    break
+                try:
+                    decoded.put((file_path, decode_file(file_path, self.resize_settings)))
+                except Exception as e:
+                    decoded.put((file_path, f"Error converting {os.path.basename(file_path)}: {str(e)}"))
+            decoded.put(None)
+
+        decoder = threading.Thread(target=decode_files, daemon=True)
+
+        # The pool outlives this batch; pending work is bounded per batch instead
+        executor = encode_pool()
+        pending = set()
+
+        def collect(return_when):
+            nonlocal pending
+            done, pending = concurrent.futures.wait(pending, return_when=return_when)
+            for future in done:
+                result = future.result()
+                if result is not True:
+                    return result
+                self._file_done()
+            return None
+
+        decoder.start()
+        try:
+            while (item := decoded.get()) is not None:
+                file_path, decoded_file = item
+                if isinstance(decoded_file, str):
+                    return decoded_file
+
+                img, new_size = decoded_file
+                pending.add(executor.submit(
+                    encode_file, img, file_path, self.output_dir, targets, new_size))
+                if len(pending) >= 2 * max_workers:
+                    failure = collect(concurrent.futures.FIRST_COMPLETED)
+                    if failure:
+                        return failure
+
+            return collect(concurrent.futures.ALL_COMPLETED)
+        finally:
+            # Drop queued encodes and let running ones finish before returning
+            for future in pending:
+                future.cancel()
+            concurrent.futures.wait(pending)
+            # Unblock and drain the decoder if we bailed out early
+            stop.set()
+            while decoder.is_alive():
+                try:
+                    decoded.get(timeout=0.1)
+                except queue.Empty:
+                    pass
 
+    @pyqtSlot()
     def run(self):
+        started = time.perf_counter_ns()
         try:
-            total_files = len(self.input_files)
-            processed_files = 0
+            self.processed_files = 0
+            self._last_emit = 0.0
+            self._last_progress = -1
             self.status_update.emit("Preparing to convert...")
 
-            format_settings = {
-                'WebP': ('.webp', 'WebP'),
-                'JPEG': ('.jpg', 'JPEG'),
-                'PNG': ('.png', 'PNG'),
-                'AVIF': ('.avif', 'AVIF')
-            }
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = []
-
-                def convert_file(file_path, output_format):
-                    try:
-                        with Image.open(file_path) as img:
-                            original_width, original_height = img.size
-
-                            if self.resize_settings:
-                                target_width = self.resize_settings['width']
-                                target_height = self.resize_settings['height']
-
-                                if self.resize_settings['keep_aspect_ratio']:
-                                    aspect_ratio = original_width / original_height
-                                    if original_width > original_height:
-                                        new_width = target_width
-                                        new_height = int(target_width / aspect_ratio)
-                                    else:
-                                        new_height = target_height
-                                        new_width = int(target_height * aspect_ratio)
-                                else:
-                                    new_width = target_width
-                                    new_height = target_height
-
-                                img = img.resize((new_width, new_height), Image.LANCZOS)
-                                original_width, original_height = new_width, new_height
-
-                            base_name = os.path.splitext(os.path.basename(file_path))[0]
-                            extension, save_format = format_settings[output_format]
-                            output_path = os.path.join(self.output_dir, f"{base_name}{extension}")
-
-                            if output_format == 'PNG':
-                                compression_level = 9 - int(100 / 11.1)  # Hardcoded quality to 100
-                                img.save(output_path, format='PNG', optimize=True, 
-                                       compress_level=min(9, max(0, compression_level)))
-                            elif output_format == 'AVIF':
-                                width, height = img.size
-                                if width % 8 != 0 or height % 8 != 0:
-                                    new_width = (width // 8) * 8
-                                    new_height = round(new_width * height / width)
-                                    new_height = (new_height // 8) * 8
-                                    img = img.resize((new_width, new_height), Image.LANCZOS)
-                                img.save(output_path, format='AVIF', quality=100)  # Hardcoded quality to 100
-                            else:
-                                if output_format == 'JPEG' and img.mode == 'RGBA':
-                                    img = img.convert('RGB')
-                                img.save(output_path, format=save_format, quality=100)  # Hardcoded quality to 100
-
-                            return True
-                    except Exception as e:
-                        return f"Error converting {os.path.basename(file_path)}: {str(e)}"
-
-                for file_path in self.input_files:
-                    if self.output_format == 'Both':
-                        futures.append(executor.submit(convert_file, file_path, 'WebP'))
-                        futures.append(executor.submit(convert_file, file_path, 'AVIF'))
-                    elif self.output_format in format_settings:
-                        futures.append(executor.submit(convert_file, file_path, self.output_format))
-                    else:
-                        self.error.emit(f"Unsupported format: {self.output_format}")
-                        return
-
-                for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                    result = future.result()
-                    if result is not True:
-                        self.error.emit(result)
-                        return
-
-                    processed_files += 1
-                    progress_value = int((processed_files / total_files) * 100)
-                    self.progress.emit(progress_value)
-                    self.status_update.emit(f"Converting files: {processed_files}/{total_files}")
+            if self.output_format == 'Both':
+                output_formats = ('WebP', 'AVIF')
+            elif self.output_format in EXTENSIONS:
+                output_formats = (self.output_format,)
+            else:
+                self.error.emit(f"Unsupported format: {self.output_format}")
+                return
+            # Resolve each format's encoder and options here rather than per file
+            targets = tuple(
+                (fmt, EXTENSIONS[fmt],
+                 functools.partial(SAVE_IMPLS[fmt], **save_options(fmt, self.quality, self.effort)))
+                for fmt in output_formats)
+
+            if self.use_processes():
+                failure = self._convert_in_processes(targets)
+            else:
+                failure = self._convert_in_threads(targets)
+            if failure:
+                self.error.emit(failure)
+                return
 
-            self.status_update.emit(f"Successfully converted {processed_files} files!")
+            elapsed = (time.perf_counter_ns() - started) / 1e9
+            self.status_update.emit(f"Successfully converted {self.processed_files} files in {elapsed:.1f}s!")
             self.progress.emit(100)
+            release_memory()
             self.finished.emit()
 
         except FileNotFoundError: